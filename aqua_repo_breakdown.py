@@ -11,59 +11,207 @@ Usage:
 """
 
 import argparse
+import io
 import json
 import sys
 import os
-from prettytable import PrettyTable
-
-# Import from aquasec library
-from aquasec import (
-    authenticate,
-    api_get_repositories,
-    get_all_repositories,
-    get_app_scopes,
-    write_json_to_file,
-    write_content_to_file,
-    load_profile_credentials,
-    interactive_setup,
-    list_profiles,
-    ConfigManager,
-    get_profile_info,
-    get_all_profiles_info,
-    format_profile_info,
-    delete_profile_with_result,
-    set_default_profile_with_result,
-    profile_not_found_response,
-    profile_operation_response
-)
+import time
+from collections import defaultdict
+from functools import lru_cache
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Version
 __version__ = "0.1.1"
 
 
-def build_repository_scope_map(server, token, verbose=False, debug=False):
-    """Build complete map of repositories and their scopes"""
-    repo_map = {}
-    
+def _load_aquasec():
+    """Import the aquasec API surface into module globals on first use
+
+    Every command needs the library, but --version, --help and argument
+    errors don't, and its import dominates cold-start time for those
+    paths. main() calls this once a real command has been selected.
+    """
+    if 'authenticate' in globals():
+        return
+    from aquasec import (
+        authenticate,
+        api_get_repositories,
+        get_all_repositories,
+        get_app_scopes,
+        write_json_to_file,
+        write_content_to_file,
+        load_profile_credentials,
+        interactive_setup,
+        list_profiles,
+        ConfigManager,
+        get_profile_info,
+        get_all_profiles_info,
+        format_profile_info,
+        delete_profile_with_result,
+        set_default_profile_with_result,
+        profile_not_found_response,
+        profile_operation_response
+    )
+    globals().update(locals())
+
+    # Wrap the fetchers used by build_repository_scope_map so commands that
+    # build the map more than once per invocation reuse the API responses.
+    # Repositories come through the local paged fetcher, which prefetches
+    # pages concurrently instead of walking them one by one.
+    globals()['get_all_repositories'] = _ttl_cached(_get_all_repositories_paged)
+    globals()['get_app_scopes'] = _ttl_cached(get_app_scopes)
+
+    _install_shared_session()
+
+
+def _get_all_repositories_paged(server, token, registry=None, scope=None, verbose=False,
+                                page_size=500, prefetch=4):
+    """Get all repositories with pagination, prefetching pages in parallel
+
+    Same contract as aquasec.get_all_repositories, but the total from the
+    first response is used to fan the remaining pages out across a small
+    thread pool rather than fetching them serially, and the larger page
+    size cuts the number of round trips per listing.
+    """
+    def fetch_page(page):
+        res = api_get_repositories(server, token, page, page_size, registry, scope, verbose)
+
+        if res.status_code != 200:
+            raise Exception(f"API call failed with status {res.status_code}: {res.text}")
+
+        return res.json()
+
+    first = fetch_page(1)
+    all_repos = first.get("result") or []
+    total = first.get("count", 0)
+
+    if len(all_repos) >= total or len(all_repos) < page_size:
+        return all_repos
+
+    remaining_pages = range(2, -(-total // page_size) + 1)
+
+    with ThreadPoolExecutor(max_workers=prefetch) as executor:
+        for data in executor.map(fetch_page, remaining_pages):
+            all_repos.extend(data.get("result") or [])
+
+        if verbose:
+            print(f"Fetched {len(all_repos)} of {total} repositories...")
+
+    return all_repos
+
+
+def _install_shared_session():
+    """Route aquasec's API calls through one pooled requests.Session
+
+    The library issues every call via module-level requests functions, so
+    each request pays a fresh TCP+TLS handshake. aquasec.common exposes no
+    session hook, so swap its requests reference for a thin shim backed by
+    a shared Session with a connection pool sized for the concurrent scope
+    fetches. Session is thread-safe for plain requests, and the shim keeps
+    the exceptions attribute the library touches.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    from aquasec import common as aquasec_common
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                          max_retries=Retry(total=3, backoff_factor=0.2))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    class _SessionShim:
+        request = staticmethod(session.request)
+        get = staticmethod(session.get)
+        exceptions = requests.exceptions
+
+    aquasec_common.requests = _SessionShim
+
+# How long memoized API responses stay valid within a single process
+_CACHE_TTL_SECONDS = 60
+
+
+def _ttl_cached(func):
+    """Memoize an API fetch for a short TTL, keyed on its query arguments.
+
+    Within one run the responses are pure functions of (server, scope,
+    registry), so repeated calls (e.g. repo list --orphan --all-scopes
+    building the scope map twice) can share results. The token and verbose
+    flag are excluded from the key. Cached lists are copied on return so
+    downstream mutation can't poison the cache.
+    """
+    cache = {}
+
+    def wrapper(server, token, **kwargs):
+        key = (server,) + tuple(sorted(
+            (k, v) for k, v in kwargs.items() if k != 'verbose'
+        ))
+        hit = cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < _CACHE_TTL_SECONDS:
+            return list(hit[1])
+        result = func(server, token, **kwargs)
+        cache[key] = (now, result)
+        return list(result)
+
+    return wrapper
+
+
+def _repo_key(repo, _get_rn=itemgetter('registry', 'name'), _intern=sys.intern):
+    """Interned (registry, name) key for a repository dict
+
+    itemgetter and intern are bound as defaults so the common case (both
+    fields present) costs a single C-level call per repo; the .get
+    fallback only runs for malformed entries.
+    """
+    try:
+        registry, name = _get_rn(repo)
+    except KeyError:
+        registry, name = repo.get('registry'), repo.get('name')
+    return (_intern(registry or 'unknown'), _intern(name or 'unknown'))
+
+
+def build_repository_scope_map(server, token, verbose=False, debug=False, orphan_only=False):
+    """Build complete map of repositories and their scopes
+
+    When orphan_only is True the per-scope results are only used to record
+    which repositories appear in at least one application scope, and the
+    returned map contains just the orphaned (Global-only) repositories.
+    """
+    # Repo data and scope membership are kept in two parallel dicts while
+    # building: sets make the per-scope membership update O(1) instead of
+    # scanning a list per repo. The legacy {"data", "scopes"} shape is
+    # materialized once at the end for callers. Keys are (registry, name)
+    # tuples of interned strings: registry names repeat across thousands of
+    # repos and repos reappear once per scope, so interning lets CPython
+    # share the storage and skips a per-pair f-string allocation. Callers
+    # join with "/" only at output time.
+    repo_data_by_key = {}
+    scopes_by_key = defaultdict(set)
+
     if verbose:
         print("Building repository scope map...")
         print("Step 1: Fetching all repositories...")
-    
+
     # Step 1: Get all repositories (these all implicitly have Global)
     try:
         all_repos = get_all_repositories(server, token, verbose=debug)
-        
+
+        # Sort once by name here so the map's insertion order is the output
+        # order and no caller has to re-sort its view (the API already
+        # orders by name, so this is a near-free pass over sorted input)
+        all_repos.sort(key=lambda r: r.get('name') or '')
+
         for repo in all_repos:
             # Create unique key from registry and name
-            registry = repo.get('registry', 'unknown')
-            name = repo.get('name', 'unknown')
-            key = f"{registry}/{name}"
-            
-            repo_map[key] = {
-                "data": repo,
-                "scopes": ["Global"]  # Start with Global
-            }
-        
+            key = _repo_key(repo)
+
+            repo_data_by_key[key] = repo
+            if not orphan_only:
+                scopes_by_key[key] = {"Global"}  # Start with Global
+
         if verbose:
             print(f"Found {len(all_repos)} total repositories")
             print("Step 2: Fetching application scopes...")
@@ -72,10 +220,31 @@ def build_repository_scope_map(server, token, verbose=False, debug=False):
         if verbose:
             print(f"Error fetching repositories: {e}")
         raise
-    
+
+    # If the API already reports scope membership on each repository there
+    # is no need to enumerate the scopes one by one
+    if all_repos and 'application_scopes' in all_repos[0]:
+        if verbose:
+            print("Repository responses include scope membership, skipping per-scope checks")
+
+        if orphan_only:
+            orphan_keys = [
+                k for k, repo in repo_data_by_key.items()
+                if not any(s != "Global" for s in repo.get('application_scopes') or [])
+            ]
+            repo_map = _materialize_orphan_map(repo_data_by_key, orphan_keys)
+        else:
+            for repo in all_repos:
+                scopes_by_key[_repo_key(repo)].update(repo.get('application_scopes') or [])
+
+            repo_map = _materialize_repo_map(repo_data_by_key, scopes_by_key)
+
+        _print_scope_map_summary(verbose, len(all_repos), repo_map, orphan_only)
+        return repo_map
+
     # Step 2: Get all application scopes (excluding Global)
     try:
-        all_scopes = get_app_scopes(server, token, debug)
+        all_scopes = get_app_scopes(server, token, verbose=debug)
         app_scopes = [s for s in all_scopes if s.get("name") != "Global"]
         
         if verbose:
@@ -88,46 +257,157 @@ def build_repository_scope_map(server, token, verbose=False, debug=False):
         raise
     
     # Step 3: For each app scope, get repos and add scope
-    for i, scope in enumerate(app_scopes):
-        scope_name = scope.get("name")
-        
-        if verbose:
-            print(f"  Checking scope {i+1}/{len(app_scopes)}: {scope_name}")
-        
-        try:
-            scope_repos = get_all_repositories(server, token, scope=scope_name, verbose=debug)
-            
-            for repo in scope_repos:
-                registry = repo.get('registry', 'unknown')
-                name = repo.get('name', 'unknown')
-                key = f"{registry}/{name}"
-                
-                if key in repo_map:
-                    if scope_name not in repo_map[key]["scopes"]:
-                        repo_map[key]["scopes"].append(scope_name)
+    # The per-scope calls are independent and dominated by HTTP round-trip
+    # latency, so dispatch them concurrently and merge results on the main
+    # thread (repo_map is only touched here, so no locking is needed)
+    def fetch_scope_repos(scope_name, attempts=2):
+        for attempt in range(attempts):
+            try:
+                return get_all_repositories(server, token, scope=scope_name, verbose=debug)
+            except Exception:
+                if attempt + 1 == attempts:
+                    raise
+                time.sleep(0.5 * (attempt + 1))
+
+    # Fast path for orphan detection: we only need to know which repos
+    # appear in at least one scope, not the full membership per repo
+    seen_in_scope = set()
+
+    if app_scopes:
+        with ThreadPoolExecutor(max_workers=min(16, len(app_scopes))) as executor:
+            futures = {
+                executor.submit(fetch_scope_repos, scope.get("name")): scope.get("name")
+                for scope in app_scopes
+            }
+
+            for i, future in enumerate(as_completed(futures)):
+                scope_name = futures[future]
+
+                if verbose:
+                    print(f"  Checking scope {i+1}/{len(app_scopes)}: {scope_name}")
+
+                try:
+                    scope_repos = future.result()
+                except Exception as e:
+                    if verbose:
+                        print(f"  Error fetching repositories for scope {scope_name}: {e}")
+                    # Continue with other scopes
+                    continue
+
+                if orphan_only:
+                    seen_in_scope.update(map(_repo_key, scope_repos))
                 else:
-                    # This shouldn't happen, but handle it gracefully
-                    if debug:
-                        print(f"WARNING: Repository {key} found in scope {scope_name} but not in all repos list")
-            
-            if debug:
-                print(f"    Found {len(scope_repos)} repositories in {scope_name}")
-                
-        except Exception as e:
-            if verbose:
-                print(f"  Error fetching repositories for scope {scope_name}: {e}")
-            # Continue with other scopes
-    
-    if verbose:
-        orphaned = sum(1 for v in repo_map.values() if v["scopes"] == ["Global"])
-        print(f"\nScope mapping complete:")
-        print(f"  Total repositories: {len(repo_map)}")
-        print(f"  Orphaned repositories: {orphaned}")
-        print(f"  Repositories with app scopes: {len(repo_map) - orphaned}")
-    
+                    # Unconditional add: the defaultdict absorbs the odd repo
+                    # that wasn't in the all-repos list (materialization only
+                    # walks repo_data_by_key, so stray entries never surface)
+                    for repo in scope_repos:
+                        key = _repo_key(repo)
+
+                        scopes_by_key[key].add(scope_name)
+
+                        # This shouldn't happen, but note it when debugging
+                        if debug and key not in repo_data_by_key:
+                            print(f"WARNING: Repository {'/'.join(key)} found in scope {scope_name} but not in all repos list")
+
+                if debug:
+                    print(f"    Found {len(scope_repos)} repositories in {scope_name}")
+
+    if orphan_only:
+        # Orphans are everything never seen in any application scope; the
+        # comprehension (rather than a set difference) keeps name order
+        repo_map = _materialize_orphan_map(
+            repo_data_by_key,
+            (k for k in repo_data_by_key if k not in seen_in_scope)
+        )
+    else:
+        repo_map = _materialize_repo_map(repo_data_by_key, scopes_by_key)
+
+    _print_scope_map_summary(verbose, len(all_repos), repo_map, orphan_only)
+
     return repo_map
 
 
+def _materialize_repo_map(repo_data_by_key, scopes_by_key):
+    """Assemble the {key: {"data", "scopes"}} map from the parallel dicts"""
+    return {
+        k: {"data": repo_data_by_key[k], "scopes": sorted(scopes_by_key[k])}
+        for k in repo_data_by_key
+    }
+
+
+def _materialize_orphan_map(repo_data_by_key, keys):
+    """Assemble the map for orphan-only results, whose scope membership is
+    the implicit Global scope by construction"""
+    return {k: {"data": repo_data_by_key[k], "scopes": ["Global"]} for k in keys}
+
+
+def _print_scope_map_summary(verbose, total, repo_map, orphan_only):
+    """Print the closing statistics for build_repository_scope_map"""
+    if not verbose:
+        return
+    if orphan_only:
+        orphaned = len(repo_map)
+    else:
+        orphaned = sum(1 for v in repo_map.values() if v["scopes"] == ["Global"])
+    print(f"\nScope mapping complete:")
+    print(f"  Total repositories: {total}")
+    print(f"  Orphaned repositories: {orphaned}")
+    print(f"  Repositories with app scopes: {total - orphaned}")
+
+
+def _render_table(field_names, rows, aligns):
+    """Print rows as a bordered table in PrettyTable's format
+
+    Column widths are computed in one pass, every line is emitted through a
+    single prebuilt format string, and the whole table goes to stdout in one
+    buffered write - no per-cell bookkeeping or full re-render on print.
+    Cells must already be strings so the render loop does nothing but
+    format; aligns is one 'l'/'c'/'r' character per column.
+    """
+    widths = [len(name) for name in field_names]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    marks = {"l": "<", "c": "^", "r": ">"}
+    border = "+" + "+".join("-" * (w + 2) for w in widths) + "+\n"
+    fmt = "|" + "|".join(
+        " {:%s%d} " % (marks[a], w) for a, w in zip(aligns, widths)
+    ) + "|\n"
+
+    out = io.StringIO()
+    out.write(border)
+    out.write(fmt.format(*field_names))
+    out.write(border)
+    for row in rows:
+        out.write(fmt.format(*row))
+    out.write(border)
+    sys.stdout.write(out.getvalue())
+
+
+def _print_repositories_json(envelope, repositories):
+    """Stream a repositories JSON document to stdout one entry at a time
+
+    Writes the envelope fields and then each repository as it is produced,
+    instead of materializing the whole document and json.dumps-ing it, so
+    peak memory stays at one repo-sized object regardless of tenant size.
+    The output is byte-identical to json.dumps(..., indent=2).
+    """
+    out = sys.stdout
+    out.write("{")
+    for field, value in envelope.items():
+        out.write(f"\n  {json.dumps(field)}: {json.dumps(value)},")
+    out.write('\n  "repositories": [')
+    first = True
+    for repo in repositories:
+        if not first:
+            out.write(",")
+        first = False
+        out.write("\n    " + json.dumps(repo, indent=2).replace("\n", "\n    "))
+    out.write("\n  ]\n}\n" if not first else "]\n}\n")
+
+
 def filter_repositories(repo_map, filter_type="all", scope_name=None):
     """Filter repositories based on criteria"""
     if filter_type == "orphaned":
@@ -147,8 +427,10 @@ def repo_list(server, token, verbose=False, debug=False, scope=None,
     
     # If we need complete scope mapping (orphan detection or showing all scopes)
     if orphan or all_scopes:
-        # Build complete repository map with scope information
-        repo_map = build_repository_scope_map(server, token, verbose, debug)
+        # Build complete repository map with scope information (orphan-only
+        # runs can skip tracking full scope membership)
+        repo_map = build_repository_scope_map(server, token, verbose, debug,
+                                              orphan_only=orphan and not all_scopes)
         
         # Apply filters
         if orphan:
@@ -157,60 +439,40 @@ def repo_list(server, token, verbose=False, debug=False, scope=None,
             filtered = repo_map
         
         # Format output
+        # The map is built in name order, so its items are already sorted
         if verbose:
             # Table format
-            table = PrettyTable()
+            sorted_items = filtered.items()
+
             if all_scopes:
-                table.field_names = ["Repository", "Registry", "Scopes", "# Scopes"]
-                table.align["Repository"] = "l"
-                table.align["Registry"] = "l"
-                table.align["Scopes"] = "l"
-                table.align["# Scopes"] = "r"
-            else:
-                table.field_names = ["Repository", "Registry"]
-                table.align["Repository"] = "l"
-                table.align["Registry"] = "l"
-            
-            # Sort by repository name for consistent output
-            sorted_items = sorted(filtered.items(), key=lambda x: x[1]["data"].get("name", ""))
-            
-            for key, value in sorted_items:
-                repo = value["data"]
-                if all_scopes:
-                    scopes_str = ", ".join(sorted(value["scopes"]))
-                    table.add_row([
-                        repo.get('name', 'N/A'),
-                        repo.get('registry', 'N/A'),
-                        scopes_str,
-                        len(value["scopes"])
+                rows = []
+                for key, value in sorted_items:
+                    repo = value["data"]
+                    # Scopes are already sorted by _materialize_repo_map
+                    rows.append([
+                        repo.get('name') or 'N/A',
+                        repo.get('registry') or 'N/A',
+                        ", ".join(value["scopes"]),
+                        str(len(value["scopes"]))
                     ])
-                else:
-                    table.add_row([
-                        repo.get('name', 'N/A'),
-                        repo.get('registry', 'N/A')
-                    ])
-            
-            print(table)
+                _render_table(["Repository", "Registry", "Scopes", "# Scopes"], rows, "lllr")
+            else:
+                rows = [
+                    [value["data"].get('name') or 'N/A', value["data"].get('registry') or 'N/A']
+                    for key, value in sorted_items
+                ]
+                _render_table(["Repository", "Registry"], rows, "ll")
+
             print(f"\nTotal repositories: {len(filtered)}")
             
             if orphan:
                 print("(Showing only orphaned repositories - those without application scope assignments)")
         else:
-            # JSON format
-            output = {
-                "count": len(filtered),
-                "repositories": []
-            }
-            
-            # Sort for consistent output
-            sorted_items = sorted(filtered.items(), key=lambda x: x[1]["data"].get("name", ""))
-            
-            for key, value in sorted_items:
-                repo_data = value["data"].copy()
-                repo_data["scopes"] = value["scopes"]
-                output["repositories"].append(repo_data)
-            
-            print(json.dumps(output, indent=2))
+            # JSON format, streamed one repository at a time
+            _print_repositories_json(
+                {"count": len(filtered)},
+                ({**value["data"], "scopes": value["scopes"]} for key, value in filtered.items())
+            )
     elif scope and scope != "Global":
         # Efficient path: Direct API call with scope filter
         try:
@@ -223,32 +485,23 @@ def repo_list(server, token, verbose=False, debug=False, scope=None,
             if verbose:
                 # Human-readable table format
                 if repos:
-                    table = PrettyTable()
-                    table.field_names = ["Repository", "Registry"]
-                    table.align["Repository"] = "l"
-                    table.align["Registry"] = "l"
-                    
                     # Sort by name
                     sorted_repos = sorted(repos, key=lambda x: x.get("name", ""))
-                    
-                    for repo in sorted_repos:
-                        table.add_row([
-                            repo.get('name', 'N/A'),
-                            repo.get('registry', 'N/A')
-                        ])
-                    
-                    print(table)
+
+                    rows = [
+                        [repo.get('name') or 'N/A', repo.get('registry') or 'N/A']
+                        for repo in sorted_repos
+                    ]
+                    _render_table(["Repository", "Registry"], rows, "ll")
                     print(f"\nTotal repositories in scope '{scope}': {len(repos)}")
                 else:
                     print(f"No repositories found in scope '{scope}'")
             else:
-                # JSON output
-                output = {
-                    "scope": scope,
-                    "count": len(repos),
-                    "repositories": sorted(repos, key=lambda x: x.get("name", ""))
-                }
-                print(json.dumps(output, indent=2))
+                # JSON output, streamed one repository at a time
+                _print_repositories_json(
+                    {"scope": scope, "count": len(repos)},
+                    sorted(repos, key=lambda x: x.get("name", ""))
+                )
                 
         except Exception as e:
             if verbose:
@@ -267,31 +520,23 @@ def repo_list(server, token, verbose=False, debug=False, scope=None,
             if verbose:
                 # Human-readable table format
                 if repos:
-                    table = PrettyTable()
-                    table.field_names = ["Repository", "Registry"]
-                    table.align["Repository"] = "l"
-                    table.align["Registry"] = "l"
-                    
                     # Sort by name
                     sorted_repos = sorted(repos, key=lambda x: x.get("name", ""))
-                    
-                    for repo in sorted_repos:
-                        table.add_row([
-                            repo.get('name', 'N/A'),
-                            repo.get('registry', 'N/A')
-                        ])
-                    
-                    print(table)
+
+                    rows = [
+                        [repo.get('name') or 'N/A', repo.get('registry') or 'N/A']
+                        for repo in sorted_repos
+                    ]
+                    _render_table(["Repository", "Registry"], rows, "ll")
                     print(f"\nTotal repositories: {len(repos)}")
                 else:
                     print("No repositories found")
             else:
-                # JSON output
-                output = {
-                    "count": len(repos),
-                    "repositories": sorted(repos, key=lambda x: x.get("name", ""))
-                }
-                print(json.dumps(output, indent=2))
+                # JSON output, streamed one repository at a time
+                _print_repositories_json(
+                    {"count": len(repos)},
+                    sorted(repos, key=lambda x: x.get("name", ""))
+                )
                 
         except Exception as e:
             if verbose:
@@ -304,30 +549,29 @@ def write_breakdown_to_csv(breakdown, repo_map, filename):
     """Export breakdown data to CSV file"""
     import csv
     
-    with open(filename, 'w', newline='') as csvfile:
+    # A large buffer plus writerows keeps the row loop inside csv's C code
+    # and lets the OS coalesce writes on big orphan lists
+    with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
         writer = csv.writer(csvfile)
-        
+
         # Write summary section
-        writer.writerow(["Summary"])
-        writer.writerow(["Metric", "Value"])
-        for key, value in breakdown["summary"].items():
-            writer.writerow([key.replace("_", " ").title(), value])
+        writer.writerows([["Summary"], ["Metric", "Value"]])
+        writer.writerows(
+            [key.replace("_", " ").title(), value]
+            for key, value in breakdown["summary"].items()
+        )
         writer.writerow([])
-        
+
         # Write scope counts
-        writer.writerow(["Scope Counts"])
-        writer.writerow(["Scope", "Repository Count"])
-        for scope, count in sorted(breakdown["scope_counts"].items()):
-            writer.writerow([scope, count])
+        writer.writerows([["Scope Counts"], ["Scope", "Repository Count"]])
+        writer.writerows(sorted(breakdown["scope_counts"].items()))
         writer.writerow([])
-        
+
         # Write orphaned repositories if any
-        orphaned = [k for k, v in repo_map.items() if v["scopes"] == ["Global"]]
+        orphaned = ["/".join(k) for k, v in repo_map.items() if v["scopes"] == ["Global"]]
         if orphaned:
-            writer.writerow(["Orphaned Repositories"])
-            writer.writerow(["Registry/Repository"])
-            for repo_key in sorted(orphaned):
-                writer.writerow([repo_key])
+            writer.writerows([["Orphaned Repositories"], ["Registry/Repository"]])
+            writer.writerows([repo_key] for repo_key in sorted(orphaned))
     
     return filename
 
@@ -339,17 +583,30 @@ def repo_breakdown(server, token, verbose=False, debug=False, csv_file=None, jso
     repo_map = build_repository_scope_map(server, token, verbose, debug)
     filtered_map = repo_map
     
-    # Calculate statistics
+    # Calculate statistics in a single pass over the map: the orphan list,
+    # per-scope counts and per-scope membership all come from the same walk
     total_repos = len(filtered_map)
-    orphaned_repos = len([v for v in filtered_map.values() if v["scopes"] == ["Global"]])
+    scope_members = defaultdict(list)
+    orphaned = []
+
+    for key, value in filtered_map.items():
+        scopes = value["scopes"]
+        joined_key = "/".join(key)
+        if scopes == ["Global"]:
+            orphaned.append(joined_key)
+        else:
+            for repo_scope in scopes:
+                if repo_scope != "Global":
+                    scope_members[repo_scope].append(joined_key)
+
+    # Every repository carries the implicit Global scope, so the counts
+    # fall out of the partition sizes rather than per-element tallying
+    scope_counts = {"Global": total_repos}
+    scope_counts.update((s, len(m)) for s, m in scope_members.items())
+
+    orphaned_repos = len(orphaned)
     scoped_repos = total_repos - orphaned_repos
-    
-    # Count by individual scope
-    scope_counts = {}
-    for repo_data in filtered_map.values():
-        for repo_scope in repo_data["scopes"]:
-            scope_counts[repo_scope] = scope_counts.get(repo_scope, 0) + 1
-    
+
     # Build breakdown data
     breakdown = {
         "summary": {
@@ -363,15 +620,14 @@ def repo_breakdown(server, token, verbose=False, debug=False, csv_file=None, jso
     }
     
     # Add detailed scope membership for non-Global scopes
-    for scope_name in scope_counts:
-        if scope_name != "Global":
-            breakdown["scope_details"][scope_name] = {
-                "count": scope_counts[scope_name],
-                "repositories": sorted([k for k, v in filtered_map.items() if scope_name in v["scopes"]])
-            }
-    
+    for scope_name, members in scope_members.items():
+        breakdown["scope_details"][scope_name] = {
+            "count": scope_counts[scope_name],
+            "repositories": sorted(members)
+        }
+
     # Add orphaned repositories list
-    breakdown["orphaned_repositories"] = sorted([k for k, v in filtered_map.items() if v["scopes"] == ["Global"]])
+    breakdown["orphaned_repositories"] = sorted(orphaned)
     
     # Output handling
     if csv_file:
@@ -389,34 +645,26 @@ def repo_breakdown(server, token, verbose=False, debug=False, csv_file=None, jso
         # Human-readable output
         print("\n=== Repository Breakdown by Scope ===\n")
         
-        table = PrettyTable()
-        table.field_names = ["Metric", "Count", "Percentage"]
-        table.align["Metric"] = "l"
-        table.align["Count"] = "r"
-        table.align["Percentage"] = "r"
-        
-        table.add_row(["Total Repositories", total_repos, "100%"])
-        table.add_row(["Orphaned (Global only)", orphaned_repos, f"{breakdown['summary']['orphaned_percentage']:.1f}%"])
-        table.add_row(["With App Scopes", scoped_repos, f"{100 - breakdown['summary']['orphaned_percentage']:.1f}%"])
-        
-        print(table)
-        
+        _render_table(
+            ["Metric", "Count", "Percentage"],
+            [
+                ["Total Repositories", str(total_repos), "100%"],
+                ["Orphaned (Global only)", str(orphaned_repos), f"{breakdown['summary']['orphaned_percentage']:.1f}%"],
+                ["With App Scopes", str(scoped_repos), f"{100 - breakdown['summary']['orphaned_percentage']:.1f}%"]
+            ],
+            "lrr"
+        )
+
         print("\n=== Repositories per Scope ===\n")
-        
-        scope_table = PrettyTable()
-        scope_table.field_names = ["Scope", "Repository Count", "Percentage"]
-        scope_table.align["Scope"] = "l"
-        scope_table.align["Repository Count"] = "r"
-        scope_table.align["Percentage"] = "r"
-        
+
         # Sort scopes: Global first, then alphabetically
         sorted_scopes = sorted(scope_counts.items(), key=lambda x: (x[0] != "Global", x[0]))
-        
-        for scope_name, count in sorted_scopes:
-            percentage = (count / total_repos * 100) if total_repos > 0 else 0
-            scope_table.add_row([scope_name, count, f"{percentage:.1f}%"])
-        
-        print(scope_table)
+
+        scope_rows = [
+            [scope_name, str(count), f"{(count / total_repos * 100) if total_repos > 0 else 0:.1f}%"]
+            for scope_name, count in sorted_scopes
+        ]
+        _render_table(["Scope", "Repository Count", "Percentage"], scope_rows, "lrr")
         
         if orphaned_repos > 0:
             print(f"\n⚠️  Alert: {orphaned_repos} repositories ({breakdown['summary']['orphaned_percentage']:.1f}%) are not assigned to any application scope.")
@@ -426,46 +674,23 @@ def repo_breakdown(server, token, verbose=False, debug=False, csv_file=None, jso
         print(json.dumps(breakdown, indent=2))
 
 
-def main():
-    """Main function"""
-    # Disable SSL warnings
-    import urllib3
-    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-    
-    # Custom argument parsing to support global options anywhere
-    # First, let's identify if we have a command and extract global args
-    raw_args = sys.argv[1:]
-    
-    # Extract global arguments regardless of position
-    global_args = {
-        'verbose': False,
-        'debug': False,
-        'profile': 'default'
-    }
-    
-    # Check for version first
-    if '--version' in raw_args:
-        print(f'aqua_repo_breakdown {__version__}')
-        sys.exit(0)
-    
-    # Extract global flags from anywhere in the command line
-    filtered_args = []
-    i = 0
-    while i < len(raw_args):
-        arg = raw_args[i]
-        if arg in ['-v', '--verbose']:
-            global_args['verbose'] = True
-        elif arg in ['-d', '--debug']:
-            global_args['debug'] = True
-        elif arg in ['-p', '--profile']:
-            if i + 1 < len(raw_args):
-                global_args['profile'] = raw_args[i + 1]
-                i += 1  # Skip the profile value
-        else:
-            filtered_args.append(arg)
-        i += 1
-    
-    # Now parse with the filtered args
+@lru_cache(maxsize=1)
+def get_parser():
+    """Build the argument parser (cached - construction walks ~30 add_argument calls)
+
+    The global flags live on a parent parser attached to the main parser
+    and every subparser, so a single argparse pass accepts them anywhere on
+    the command line - no manual sys.argv pre-scan. SUPPRESS defaults keep
+    a subparser from overwriting a value an outer parser already recorded.
+    """
+    global_parser = argparse.ArgumentParser(add_help=False)
+    global_parser.add_argument('-v', '--verbose', action='store_true', default=argparse.SUPPRESS,
+                               help='Show human-readable output instead of JSON')
+    global_parser.add_argument('-d', '--debug', action='store_true', default=argparse.SUPPRESS,
+                               help='Show debug output including API calls')
+    global_parser.add_argument('-p', '--profile', default=argparse.SUPPRESS,
+                               help='Configuration profile to use (default: default)')
+
     parser = argparse.ArgumentParser(
         description='Aqua Repository Breakdown Utility - Analyze repository scope assignments in Aqua Security platform',
         prog='aqua_repo_breakdown',
@@ -474,69 +699,118 @@ def main():
                '  -d, --debug          Show debug output including API calls\n'
                '  -p, --profile        Configuration profile to use (default: default)\n'
                '  --version            Show program version',
-        formatter_class=argparse.RawDescriptionHelpFormatter
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        parents=[global_parser]
     )
-    
+    parser.add_argument('--version', action='version',
+                        version=f'aqua_repo_breakdown {__version__}')
+
     # Create subparsers for commands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
-    
+
     # Setup command
-    setup_parser = subparsers.add_parser('setup', help='Interactive setup wizard')
+    setup_parser = subparsers.add_parser('setup', help='Interactive setup wizard',
+                                         parents=[global_parser])
     setup_parser.add_argument('profile_name', nargs='?', help='Profile name to create/update (optional)')
-    
+
     # Profile command with subcommands
-    profile_parser = subparsers.add_parser('profile', help='Manage configuration profiles')
+    profile_parser = subparsers.add_parser('profile', help='Manage configuration profiles',
+                                           parents=[global_parser])
     profile_subparsers = profile_parser.add_subparsers(dest='profile_command', help='Profile management commands')
-    
+
     # Profile list
-    profile_list_parser = profile_subparsers.add_parser('list', help='List available profiles')
-    
+    profile_list_parser = profile_subparsers.add_parser('list', help='List available profiles',
+                                                        parents=[global_parser])
+
     # Profile show
-    profile_show_parser = profile_subparsers.add_parser('show', help='Show profile details')
+    profile_show_parser = profile_subparsers.add_parser('show', help='Show profile details',
+                                                        parents=[global_parser])
     profile_show_parser.add_argument('name', nargs='?', help='Profile name to show (defaults to current default profile)')
-    
+
     # Profile delete
-    profile_delete_parser = profile_subparsers.add_parser('delete', help='Delete a profile')
+    profile_delete_parser = profile_subparsers.add_parser('delete', help='Delete a profile',
+                                                          parents=[global_parser])
     profile_delete_parser.add_argument('name', help='Profile name to delete')
-    
+
     # Profile set-default
-    profile_default_parser = profile_subparsers.add_parser('set-default', help='Set default profile')
+    profile_default_parser = profile_subparsers.add_parser('set-default', help='Set default profile',
+                                                           parents=[global_parser])
     profile_default_parser.add_argument('name', help='Profile name to set as default')
-    
+
     # Repo command with subcommands
-    repo_parser = subparsers.add_parser('repo', help='Repository analysis commands')
+    repo_parser = subparsers.add_parser('repo', help='Repository analysis commands',
+                                        parents=[global_parser])
     repo_subparsers = repo_parser.add_subparsers(dest='repo_command', help='Repository commands')
-    
+
     # Repo list
-    repo_list_parser = repo_subparsers.add_parser('list', help='List repositories (all by default, use -v for table)')
+    repo_list_parser = repo_subparsers.add_parser('list', help='List repositories (all by default, use -v for table)',
+                                                  parents=[global_parser])
     repo_list_parser.add_argument('--scope', help='Filter by application scope')
     repo_list_parser.add_argument('--registry', help='Filter by registry')
     repo_list_parser.add_argument('--orphan', action='store_true',
                                  help='Show only orphaned repositories (no app scope assignments)')
     repo_list_parser.add_argument('--all-scopes', action='store_true',
                                  help='Show all scope assignments for each repository')
-    
+
     # Repo breakdown
-    repo_breakdown_parser = repo_subparsers.add_parser('breakdown', 
-                                help='Show repository scope analysis (JSON by default, use -v for table)')
-    repo_breakdown_parser.add_argument('--csv-file', dest='csv_file', action='store', 
+    repo_breakdown_parser = repo_subparsers.add_parser('breakdown',
+                                help='Show repository scope analysis (JSON by default, use -v for table)',
+                                parents=[global_parser])
+    repo_breakdown_parser.add_argument('--csv-file', dest='csv_file', action='store',
                                 help='Export to CSV file')
-    repo_breakdown_parser.add_argument('--json-file', dest='json_file', action='store', 
+    repo_breakdown_parser.add_argument('--json-file', dest='json_file', action='store',
                                 help='Export to JSON file')
-    
-    # Parse the filtered arguments
-    args = parser.parse_args(filtered_args)
-    
-    # Add global args to the namespace
-    args.verbose = global_args['verbose']
-    args.debug = global_args['debug']
-    args.profile = global_args['profile']
-    
+
+    return parser
+
+
+def format_all_help():
+    """Return help text for the main parser and every subcommand
+
+    Keyed by the space-joined command path ('' for the main parser,
+    e.g. 'repo list'), so callers do not need to walk argparse internals.
+    """
+    helps = {}
+
+    def _walk(parser, path):
+        helps[path] = parser.format_help()
+        for action in parser._actions:
+            if isinstance(action, argparse._SubParsersAction):
+                for name, sub in action.choices.items():
+                    _walk(sub, f'{path} {name}'.strip())
+
+    _walk(get_parser(), '')
+    return helps
+
+
+def parse_global_args(argv=None):
+    """Parse the command line, filling in defaults for the global flags
+
+    The global flags use SUPPRESS defaults so they can be given at any
+    parser level without an inner parser clobbering an outer one; this is
+    the single place the fallbacks are applied.
+    """
+    args = get_parser().parse_args(argv)
+    args.verbose = getattr(args, 'verbose', False)
+    args.debug = getattr(args, 'debug', False)
+    args.profile = getattr(args, 'profile', 'default')
+    return args
+
+
+def main(argv=None):
+    """Main function"""
+    args = parse_global_args(argv)
+
     # Show help if no command provided
     if args.command is None:
-        parser.print_help()
+        get_parser().print_help()
         sys.exit(1)
-    
+
+    # Only load the heavy dependencies once a real command is running
+    _load_aquasec()
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
     # Handle setup command
     if args.command == 'setup':
         # Use positional argument if provided, otherwise fall back to -p flag
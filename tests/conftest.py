@@ -0,0 +1,31 @@
+"""Shared fixtures for the test suite"""
+import pathlib
+import pytest
+
+SCRIPT_PATH = pathlib.Path(__file__).resolve().parent.parent / 'aqua_repo_breakdown.py'
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'slow: tests that spawn subprocesses')
+
+
+@pytest.fixture(scope='session')
+def script_path():
+    """Absolute path to the main script"""
+    return str(SCRIPT_PATH)
+
+
+@pytest.fixture(scope='session')
+def script_source():
+    """The script's source text, read once per session"""
+    return SCRIPT_PATH.read_text()
+
+
+@pytest.fixture(scope='session')
+def compiled_script(script_path, script_source):
+    """Syntax-check the script once per session, without writing a .pyc"""
+    try:
+        compile(script_source, script_path, 'exec')
+    except SyntaxError:
+        pytest.fail("Syntax error in aqua_repo_breakdown.py")
+    return script_path